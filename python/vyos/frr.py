@@ -346,18 +346,21 @@ def _find_first_block(config, start_pattern, stop_pattern, start_at=0):
     After a successful run a set is returned containing the start and stop line numbers.
     '''
     LOG.debug(f'_find_first_block: find start={repr(start_pattern)} stop={repr(stop_pattern)} start_at={start_at}')
+    # compile the patterns only once and not for every line in the config
+    start_re = re.compile(start_pattern)
+    stop_re = re.compile(stop_pattern)
     _start = None
     for i, element in enumerate(config[start_at:], start=start_at):
         # LOG.debug(f'_find_first_block: running line {i:3} "{element}"')
         if not _start:
-            if not re.match(start_pattern, element):
+            if not start_re.match(element):
                 LOG.debug(f'_find_first_block: no match     {i:3} "{element}"')
                 continue
             _start = i
             LOG.debug(f'_find_first_block: Found start  {i:3} "{element}"')
             continue
 
-        if not re.match(stop_pattern, element):
+        if not stop_re.match(element):
             LOG.debug(f'_find_first_block: no match     {i:3} "{element}"')
             continue
 
@@ -368,10 +371,22 @@ def _find_first_block(config, start_pattern, stop_pattern, start_at=0):
     return None
 
 
+def _compile_element_pattern(pattern):
+    '''Compile a pattern matching an entire config line
+    pattern:  (raw-str) The pattern, it gets anchored at the end of the line
+              (re.Pattern) A pre-compiled pattern, it is used as is
+
+    return:   re.Pattern object
+    '''
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return re.compile(pattern + '$')
+
+
 def _find_first_element(config, pattern, start_at=0):
     '''Find the first element that matches the current pattern in config
     config:        (list) A list containing the configuration that is searched
-    start_pattern: (raw-str) The pattern searched for
+    start_pattern: (raw-str/re.Pattern) The pattern searched for
     start_at:      (int) The index to start searching at in the <config>
 
     return:   Line index of the line containing the searched pattern
@@ -380,8 +395,9 @@ def _find_first_element(config, pattern, start_at=0):
     TODO: that means that we can not use False matching to tell if its
     '''
     LOG.debug(f'_find_first_element: find start="{pattern}" start_at={start_at}')
+    pattern_re = _compile_element_pattern(pattern)
     for i, element in enumerate(config[start_at:], start=0):
-        if re.match(pattern + '$', element):
+        if pattern_re.match(element):
             LOG.debug(f'_find_first_element: Found stop {i:3} "{element}"')
             return i
         LOG.debug(f'_find_first_element: no match   {i:3} "{element}"')
@@ -392,13 +408,14 @@ def _find_first_element(config, pattern, start_at=0):
 def _find_elements(config, pattern, start_at=0):
     '''Find all instances of pattern and return a list containing all element indexes
     config:        (list) A list containing the configuration that is searched
-    start_pattern: (raw-str) The pattern searched for
+    start_pattern: (raw-str/re.Pattern) The pattern searched for
     start_at:      (int) The index to start searching at in the <config>
 
     return:    A list of line indexes containing the searched pattern
     TODO: refactor this to return a generator instead
     '''
-    return [i for i, element in enumerate(config[start_at:], start=0) if re.match(pattern + '$', element)]
+    pattern_re = _compile_element_pattern(pattern)
+    return [i for i, element in enumerate(config[start_at:], start=0) if pattern_re.match(element)]
 
 
 class FRRConfig:
@@ -459,6 +476,12 @@ class FRRConfig:
 
         Configuration is automatically saved after apply
         '''
+        # Nothing to do if the configuration loaded from FRR was not altered,
+        # spare the frr-reload run and the subsequent save
+        if self.imported_config and self.config == self.original_config:
+            LOG.debug('commit_configuration: Configuration unchanged, skipping commit')
+            return
+
         LOG.debug('commit_configuration:  Commiting configuration')
         for i, e in enumerate(self.config):
             LOG.debug(f'commit_configuration: new_config {i:3} {e}')
@@ -140,8 +140,11 @@ def render(
     # calling open() to not accidentally erase the file if rendering fails
     rendered = render_to_string(template, content, formater, location)
 
-    # Write to file
-    with open(destination, "w") as file:
+    # Write to file - create it with the requested permission in the first
+    # place, so the content is never accessible through a wider file mode
+    mode = 0o666 if permission is None else permission
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with open(fd, "w") as file:
         chmod(file.fileno(), permission)
         chown(file.fileno(), user, group)
         file.write(rendered)
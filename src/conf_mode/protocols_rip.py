@@ -16,6 +16,7 @@
 
 import os
 
+from functools import lru_cache
 from sys import exit
 
 from vyos.config import Config
@@ -24,14 +25,17 @@ from vyos.configdict import node_changed
 from vyos.configverify import verify_common_route_maps
 from vyos.configverify import verify_access_list
 from vyos.configverify import verify_prefix_list
-from vyos.util import dict_search
 from vyos.xml import defaults
-from vyos.template import render_to_string
 from vyos import ConfigError
 from vyos import frr
 from vyos import airbag
 airbag.enable()
 
+@lru_cache(maxsize=None)
+def get_defaults():
+    """ Default values do not change at runtime - retrieve them only once """
+    return defaults(['protocols', 'rip'])
+
 def get_config(config=None):
     if config:
         conf = config
@@ -55,7 +59,7 @@ def get_config(config=None):
 
     # We have gathered the dict representation of the CLI, but there are default
     # options which we need to update into the dictionary retrived.
-    default_values = defaults(base)
+    default_values = get_defaults()
     # merge in remaining default values
     rip = dict_merge(default_values, rip)
 
@@ -64,9 +68,14 @@ def get_config(config=None):
     #
     # XXX: one MUST always call this without the key_mangling() option! See
     # vyos.configverify.verify_common_route_maps() for more information.
-    tmp = conf.get_config_dict(['policy'])
+    #
+    # Only retrieve the policy subtrees which are referenced by verify() -
+    # there is no need to convert e.g. large community- or as-path-lists.
+    tmp = {}
+    for policy in ['access-list', 'prefix-list', 'route-map']:
+        tmp.update(conf.get_config_dict(['policy', policy]))
     # Merge policy dict into "regular" config dict
-    rip = dict_merge(tmp, rip)
+    rip = dict_merge({'policy' : tmp}, rip)
 
     return rip
 
@@ -76,25 +85,25 @@ def verify(rip):
 
     verify_common_route_maps(rip)
 
-    acl_in = dict_search('distribute_list.access_list.in', rip)
-    if acl_in: verify_access_list(acl_in, rip)
-
-    acl_out = dict_search('distribute_list.access_list.out', rip)
-    if acl_out: verify_access_list(acl_out, rip)
-
-    prefix_list_in = dict_search('distribute_list.prefix-list.in', rip)
-    if prefix_list_in: verify_prefix_list(prefix_list_in, rip)
+    if 'distribute_list' in rip:
+        access_list = rip['distribute_list'].get('access_list', {})
+        prefix_list = rip['distribute_list'].get('prefix_list', {})
 
-    prefix_list_out = dict_search('distribute_list.prefix_list.out', rip)
-    if prefix_list_out: verify_prefix_list(prefix_list_out, rip)
+        for direction in ['in', 'out']:
+            if direction in access_list:
+                verify_access_list(access_list[direction], rip)
+            if direction in prefix_list:
+                verify_prefix_list(prefix_list[direction], rip)
 
     if 'interface' in rip:
         for interface, interface_options in rip['interface'].items():
             if 'authentication' in interface_options:
-                if {'md5', 'plaintext_password'} <= set(interface_options['authentication']):
+                tmp = interface_options['authentication']
+                if 'md5' in tmp and 'plaintext_password' in tmp:
                     raise ConfigError('Can not use both md5 and plaintext-password at the same time!')
             if 'split_horizon' in interface_options:
-                if {'disable', 'poison_reverse'} <= set(interface_options['split_horizon']):
+                tmp = interface_options['split_horizon']
+                if 'disable' in tmp and 'poison_reverse' in tmp:
                     raise ConfigError(f'You can not have "split-horizon poison-reverse" enabled ' \
                                       f'with "split-horizon disable" for "{interface}"!')
 
@@ -102,6 +111,8 @@ def generate(rip):
     if not rip or 'deleted' in rip:
         return None
 
+    # Jinja2 is only required when there is a configuration to render
+    from vyos.template import render_to_string
     rip['new_frr_config'] = render_to_string('frr/ripd.frr.j2', rip)
     return None
 
@@ -114,11 +125,11 @@ def apply(rip):
 
     # The route-map used for the FIB (zebra) is part of the zebra daemon
     frr_cfg.load_configuration(zebra_daemon)
-    frr_cfg.modify_section('^ip protocol rip route-map [-a-zA-Z0-9.]+', stop_pattern='(\s|!)')
+    frr_cfg.modify_section(r'^ip protocol rip route-map [-a-zA-Z0-9.]+', stop_pattern=r'(\s|!)')
     frr_cfg.commit_configuration(zebra_daemon)
 
     frr_cfg.load_configuration(rip_daemon)
-    frr_cfg.modify_section('^key chain \S+', stop_pattern='^exit', remove_stop_mark=True)
+    frr_cfg.modify_section(r'^key chain \S+', stop_pattern='^exit', remove_stop_mark=True)
     frr_cfg.modify_section('^router rip', stop_pattern='^exit', remove_stop_mark=True)
 
     for key in ['interface', 'interface_removed']:
@@ -15,6 +15,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import re
 
 from crypt import crypt
 from crypt import METHOD_SHA512
@@ -35,6 +36,8 @@ from vyos.util import call
 from vyos.util import run
 from vyos.util import DEVNULL
 from vyos.util import dict_search
+from vyos.util import read_file
+from vyos.util import write_file
 from vyos.xml import defaults
 from vyos import ConfigError
 from vyos import airbag
@@ -42,17 +45,62 @@ airbag.enable()
 
 autologout_file = "/etc/profile.d/autologout.sh"
 radius_config_file = "/etc/pam_radius_auth.conf"
+pam_common_auth_file = "/etc/pam.d/common-auth"
+nsswitch_config_file = "/etc/nsswitch.conf"
+
+# Regular expressions used to make the NSS system aware of RADIUS. This fancy
+# snippet was copied from old Vyatta code where it was a sed(1) script.
+nss_mapname_re = re.compile(r'\smapname')
+nss_whitespace_re = re.compile(r'\s\s*')
+nss_comment_re = re.compile(r'#.*')
+nss_group_re = re.compile(r': *')
+nss_remove_mapuid_re = re.compile(r'mapuid[ \t]')
+nss_remove_mapname_re = re.compile(r'[ \t]mapname')
+
+def nss_radius_enable(line):
+    """Add mapuid/mapname to the passwd and group lines of nsswitch.conf"""
+    if nss_mapname_re.search(line):
+        return line
+    if line.startswith('passwd:'):
+        line = nss_whitespace_re.sub(r'\g<0>mapuid ', line, count=1)
+        if '#' in line:
+            line = nss_comment_re.sub(r'mapname \g<0>', line, count=1)
+        else:
+            line += ' mapname '
+    elif line.startswith('group:'):
+        if '#' in line:
+            line = nss_comment_re.sub(r' mapname \g<0>', line, count=1)
+        else:
+            line = nss_group_re.sub(r'\g<0>mapname ', line, count=1)
+    return line
+
+def nss_radius_disable(line):
+    """Remove mapuid/mapname from the passwd and group lines of nsswitch.conf"""
+    if line.startswith('passwd:'):
+        line = nss_remove_mapuid_re.sub('', line, count=1)
+        line = nss_remove_mapname_re.sub('', line, count=1)
+    elif line.startswith('group:'):
+        line = nss_remove_mapname_re.sub('', line, count=1)
+    return line.rstrip(' \t')
+
+def update_nsswitch(modifier):
+    """Apply modifier to every line of nsswitch.conf and atomically replace it"""
+    with open(nsswitch_config_file, 'r') as f:
+        config = f.read()
+
+    new_config = '\n'.join(modifier(line) for line in config.split('\n'))
+    if new_config == config:
+        return
+
+    tmp_file = f'{nsswitch_config_file}.tmp'
+    write_file(tmp_file, new_config, mode=0o644)
+    os.replace(tmp_file, nsswitch_config_file)
 
 def get_local_users():
     """Return list of dynamically allocated users (see Debian Policy Manual)"""
-    local_users = []
-    for s_user in getpwall():
-        uid = getpwnam(s_user.pw_name).pw_uid
-        if uid in range(1000, 29999):
-            if s_user.pw_name not in ['radius_user', 'radius_priv_user']:
-                local_users.append(s_user.pw_name)
-
-    return local_users
+    excluded_users = ['radius_user', 'radius_priv_user']
+    return [s_user.pw_name for s_user in getpwall()
+            if 1000 <= s_user.pw_uid < 29999 and s_user.pw_name not in excluded_users]
 
 
 def get_config(config=None):
@@ -119,15 +167,12 @@ def verify(login):
         if 'server' not in login['radius']:
             raise ConfigError('No RADIUS server defined!')
 
-        fail = True
-        for server, server_config in dict_search('radius.server', login).items():
+        servers = login['radius']['server']
+        for server, server_config in servers.items():
             if 'key' not in server_config:
                 raise ConfigError(f'RADIUS server "{server}" requires key!')
 
-            if 'disabled' not in server_config:
-                fail = False
-                continue
-        if fail:
+        if not any('disable' not in server_config for server_config in servers.values()):
             raise ConfigError('All RADIUS servers are disabled')
 
         verify_vrf(login['radius'])
@@ -198,8 +243,12 @@ def generate(login):
                     pass
 
     if 'radius' in login:
-        render(radius_config_file, 'login/pam_radius_auth.conf.j2', login,
+        # Render into a temporary file which then replaces the active one, a
+        # login in parallel must never see an empty or partial configuration
+        tmp_file = f'{radius_config_file}.tmp'
+        render(tmp_file, 'login/pam_radius_auth.conf.j2', login,
                    permission=0o600, user='root', group='root')
+        os.replace(tmp_file, radius_config_file)
     else:
         if os.path.isfile(radius_config_file):
             os.unlink(radius_config_file)
@@ -294,31 +343,23 @@ def apply(login):
     #
     env = os.environ.copy()
     env['DEBIAN_FRONTEND'] = 'noninteractive'
+    # pam-auth-update re-writes all /etc/pam.d/common-* files, only call it
+    # when the RADIUS PAM profile needs to be enabled or removed. No shell is
+    # required to run it, thus spawn it directly
+    pam_radius = 'pam_radius_auth.so' in read_file(pam_common_auth_file, defaultonfailure='')
     try:
         if 'radius' in login:
             # Enable RADIUS in PAM
-            cmd('pam-auth-update --package --enable radius', env=env)
+            if not pam_radius:
+                cmd(['pam-auth-update', '--package', '--enable', 'radius'], env=env, shell=False)
             # Make NSS system aware of RADIUS
-            # This fancy snipped was copied from old Vyatta code
-            command = "sed -i -e \'/\smapname/b\' \
-                          -e \'/^passwd:/s/\s\s*/&mapuid /\' \
-                          -e \'/^passwd:.*#/s/#.*/mapname &/\' \
-                          -e \'/^passwd:[^#]*$/s/$/ mapname &/\' \
-                          -e \'/^group:.*#/s/#.*/ mapname &/\' \
-                          -e \'/^group:[^#]*$/s/: */&mapname /\' \
-                          /etc/nsswitch.conf"
+            update_nsswitch(nss_radius_enable)
         else:
             # Disable RADIUS in PAM
-            cmd('pam-auth-update --package --remove radius', env=env)
+            if pam_radius:
+                cmd(['pam-auth-update', '--package', '--remove', 'radius'], env=env, shell=False)
             # Drop RADIUS from NSS NSS system
-            # This fancy snipped was copied from old Vyatta code
-            command = "sed -i -e \'/^passwd:.*mapuid[ \t]/s/mapuid[ \t]//\' \
-                   -e \'/^passwd:.*[ \t]mapname/s/[ \t]mapname//\' \
-                   -e \'/^group:.*[ \t]mapname/s/[ \t]mapname//\' \
-                   -e \'s/[ \t]*$//\' \
-                   /etc/nsswitch.conf"
-
-        cmd(command)
+            update_nsswitch(nss_radius_disable)
     except Exception as e:
         raise ConfigError(f'RADIUS configuration failed: {e}')
 
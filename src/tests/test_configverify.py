@@ -15,7 +15,10 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from unittest import TestCase
+from vyos import ConfigError
+from vyos.configverify import verify_access_list
 from vyos.configverify import verify_diffie_hellman_length
+from vyos.configverify import verify_prefix_list
 from vyos.util import cmd
 
 dh_file = '/tmp/dh.pem'
@@ -36,3 +39,18 @@ class TestDictSearch(TestCase):
         key_len = '512'
         cmd(f'openssl dhparam -out {dh_file} {key_len}')
         self.assertTrue(verify_diffie_hellman_length(dh_file, key_len))
+
+    def test_prefix_list(self):
+        config = {'policy' : {'prefix-list' : {'foo-bar' : {}},
+                              'prefix-list6' : {'foo' : {}}}}
+        verify_prefix_list('foo-bar', config)
+        verify_prefix_list('foo', config, version='6')
+        self.assertRaises(ConfigError, verify_prefix_list, 'foo_bar', config)
+        self.assertRaises(ConfigError, verify_prefix_list, 'foo', config)
+        self.assertRaises(ConfigError, verify_prefix_list, 'foo', {})
+
+    def test_access_list(self):
+        config = {'policy' : {'access-list' : {'100' : {}}}}
+        verify_access_list('100', config)
+        self.assertRaises(ConfigError, verify_access_list, '101', config)
+        self.assertRaises(ConfigError, verify_access_list, '100', config, version='6')